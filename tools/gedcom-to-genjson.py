@@ -8,11 +8,16 @@ Usage:
 
 Options:
   -v, --verbose       Enable verbose output
-  --no-validate       Skip validation of the output
+  --no-validate       Skip validation of the output; records are then streamed
+                      to the output file instead of being built in memory first
   --compact           Output compact JSON (no indentation)
   --pretty            Output pretty-printed JSON (default)
   --indent N          Number of spaces for indentation (default: 2)
+                      orjson, when installed, is only used for an indent of 2
   --skip-empty        Skip empty fields in the output
+  --jsonl             Output JSON Lines: a header line, then one individual,
+                      family, source or media record per line; like the other
+                      formats it is only streamed together with --no-validate
   --encoding          Input file encoding (default: utf-8-sig)
 
 Examples:
@@ -20,37 +25,54 @@ Examples:
   python gedcom-to-genjson.py family.ged family.json --verbose
   python gedcom-to-genjson.py family.ged family.json --compact
   python gedcom-to-genjson.py family.ged family.json --skip-empty
+  python gedcom-to-genjson.py family.ged family.jsonl --jsonl
 """
 
 import json
 import sys
-import os
 import re
 import argparse
 import logging
 from typing import Dict, List, Any, Optional, Tuple, Set
-from datetime import datetime
+from datetime import date
 from dataclasses import dataclass, field
 from collections import defaultdict
 
+try:
+    import orjson
+except ImportError:  # optional accelerator, fall back to the stdlib encoder
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Shape of a YYYY-MM-DD date; fromisoformat alone also accepts other ISO forms
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}', re.ASCII)
+
+
+def _xref(value: str) -> str:
+    """Return the ID from an @XREF@ pointer value."""
+    if value[:1] == '@' and value[-1:] == '@':
+        return value[1:-1]
+    return value.strip('@')
+
 
-@dataclass
+@dataclass(slots=True)
 class Individual:
     """Represents an individual in the genealogy."""
     id: str
     full_name: str = ""
     sex: str = "U"
-    birth: Dict[str, str] = field(default_factory=dict)
-    death: Dict[str, str] = field(default_factory=dict)
-    parents: List[str] = field(default_factory=list)
-    spouses: List[str] = field(default_factory=list)
-    children: List[str] = field(default_factory=list)
-    sources: List[str] = field(default_factory=list)
-    notes: List[str] = field(default_factory=list)
+    # Event details, sources and notes are created on first write; most stay empty
+    birth: Optional[Dict[str, str]] = None
+    death: Optional[Dict[str, str]] = None
+    # Relationship IDs are kept as insertion-ordered dicts used as ordered sets
+    parents: Dict[str, None] = field(default_factory=dict)
+    spouses: Dict[str, None] = field(default_factory=dict)
+    children: Dict[str, None] = field(default_factory=dict)
+    sources: Optional[List[str]] = None
+    notes: Optional[List[str]] = None
 
     def to_dict(self, skip_empty: bool = False) -> Dict[str, Any]:
         """Convert to dictionary, optionally skipping empty fields."""
@@ -60,32 +82,34 @@ class Individual:
         }
 
         if not skip_empty or self.birth:
-            result["birth"] = self.birth
+            result["birth"] = self.birth or {}
         if not skip_empty or self.death:
-            result["death"] = self.death
+            result["death"] = self.death or {}
         if not skip_empty or self.parents:
-            result["parents"] = self.parents
+            result["parents"] = list(self.parents)
         if not skip_empty or self.spouses:
-            result["spouses"] = self.spouses
+            result["spouses"] = list(self.spouses)
         if not skip_empty or self.children:
-            result["children"] = self.children
+            result["children"] = list(self.children)
         if not skip_empty or self.sources:
-            result["sources"] = self.sources
+            result["sources"] = self.sources or []
         if not skip_empty or self.notes:
-            result["notes"] = self.notes
+            result["notes"] = self.notes or []
 
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class Family:
     """Represents a family unit in the genealogy."""
     id: str
     husband: str = ""
     wife: str = ""
-    marriage: Dict[str, str] = field(default_factory=dict)
-    children: List[str] = field(default_factory=list)
-    notes: List[str] = field(default_factory=list)
+    # Marriage details and notes are created on first write
+    marriage: Optional[Dict[str, str]] = None
+    # Child IDs are kept as an insertion-ordered dict used as an ordered set
+    children: Dict[str, None] = field(default_factory=dict)
+    notes: Optional[List[str]] = None
 
     def to_dict(self, skip_empty: bool = False) -> Dict[str, Any]:
         """Convert to dictionary, optionally skipping empty fields."""
@@ -96,15 +120,133 @@ class Family:
         if not skip_empty or self.wife:
             result["wife"] = self.wife
         if not skip_empty or self.marriage:
-            result["marriage"] = self.marriage
+            result["marriage"] = self.marriage or {}
         if not skip_empty or self.children:
-            result["children"] = self.children
+            result["children"] = list(self.children)
         if not skip_empty or self.notes:
-            result["notes"] = self.notes
+            result["notes"] = self.notes or []
 
         return result
 
 
+@dataclass(slots=True)
+class _ParseState:
+    """Tracks the record being built while parsing GEDCOM lines."""
+    record: Any = None
+    record_type: Optional[str] = None
+    event: Optional[str] = None
+    note_id: Optional[str] = None
+    # Lines of the open NOTE record, joined into self.notes when the record ends
+    note_parts: Optional[List[str]] = None
+
+
+# Tag handlers used by GedcomParser. Each takes (record, value, parser).
+def _set_name(individual: Individual, value: str, parser: 'GedcomParser'):
+    """Set the full name from a NAME value."""
+    # Remove slashes used to denote surnames
+    individual.full_name = value.replace('/', '').strip()
+
+
+def _set_sex(individual: Individual, value: str, parser: 'GedcomParser'):
+    """Set the sex from a SEX value, defaulting to U."""
+    sex = value.strip()
+    individual.sex = sex if sex in ['M', 'F'] else 'U'
+
+
+def _add_fams(individual: Individual, value: str, parser: 'GedcomParser'):
+    """Record a spouse family; replaced by the spouse ID later."""
+    individual.spouses[parser._ref(value)] = None
+
+
+def _attach_note(record: Any, value: str, parser: 'GedcomParser'):
+    """Attach an inline note or a referenced NOTE record."""
+    if value[:1] == '@':
+        # Reference to a NOTE record
+        note = parser.notes.get(_xref(value))
+        if note is None:
+            return
+    else:
+        note = value
+    if record.notes is None:
+        record.notes = []
+    record.notes.append(note)
+
+
+def _attach_source(individual: Individual, value: str, parser: 'GedcomParser'):
+    """Attach a referenced SOUR record."""
+    if value[:1] == '@':
+        if individual.sources is None:
+            individual.sources = []
+        individual.sources.append(parser._ref(value))
+
+
+def _set_husband(family: Family, value: str, parser: 'GedcomParser'):
+    """Set the husband reference."""
+    family.husband = parser._ref(value)
+
+
+def _set_wife(family: Family, value: str, parser: 'GedcomParser'):
+    """Set the wife reference."""
+    family.wife = parser._ref(value)
+
+
+def _add_child(family: Family, value: str, parser: 'GedcomParser'):
+    """Add a child reference."""
+    family.children[parser._ref(value)] = None
+
+
+def _set_source_title(source: Dict[str, str], value: str, parser: 'GedcomParser'):
+    """Set the source title."""
+    source['title'] = value
+
+
+def _set_source_text(source: Dict[str, str], value: str, parser: 'GedcomParser'):
+    """Set the source description from its TEXT value."""
+    source['description'] = value
+
+
+def _set_event_date(event: Dict[str, str], value: str, parser: 'GedcomParser'):
+    """Set the event date if it can be parsed."""
+    iso_date = parser.parse_date(value)
+    if iso_date:
+        event['date'] = iso_date
+
+
+def _set_event_place(event: Dict[str, str], value: str, parser: 'GedcomParser'):
+    """Set the event place."""
+    event['place'] = value
+
+
+# Level 1 individual tags; FAMC is resolved later from the family records
+_INDI_L1_HANDLERS = {
+    'NAME': _set_name,
+    'SEX': _set_sex,
+    'FAMS': _add_fams,
+    'NOTE': _attach_note,
+    'SOUR': _attach_source,
+}
+
+# Level 1 family tags
+_FAM_L1_HANDLERS = {
+    'HUSB': _set_husband,
+    'WIFE': _set_wife,
+    'CHIL': _add_child,
+    'NOTE': _attach_note,
+}
+
+# Level 1 source tags
+_SOUR_L1_HANDLERS = {
+    'TITL': _set_source_title,
+    'TEXT': _set_source_text,
+}
+
+# Level 2 tags under a tracked event (BIRT, DEAT, MARR)
+_EVENT_L2_HANDLERS = {
+    'DATE': _set_event_date,
+    'PLAC': _set_event_place,
+}
+
+
 class GedcomParser:
     """Parser for GEDCOM files."""
 
@@ -118,6 +260,32 @@ class GedcomParser:
     # Date qualifiers to remove
     DATE_QUALIFIERS = ['ABT', 'EST', 'BEF', 'AFT', 'CAL', 'FROM', 'TO', 'BET', 'AND']
 
+    # Qualifier prefixes, compared case-insensitively against the start of a date
+    _QUAL_PREFIXES = tuple(f'{qualifier} ' for qualifier in DATE_QUALIFIERS)
+    _QUAL_PREFIX_LEN = max(len(prefix) for prefix in _QUAL_PREFIXES)
+    # Qualifiers that open a two-date range ("BET x AND y", "FROM x TO y")
+    _RANGE_PREFIXES = ('BET ', 'FROM ')
+
+    # Precompiled date expressions, built once instead of on every parse_date call
+    _PAREN_RE = re.compile(r'\([^)]*\)')
+    _RANGE_SEP_RE = re.compile(r'\s+(?:AND|TO)\s+', re.IGNORECASE)
+
+    # (pattern, formatter) pairs; formatters receive the match object and _month_number
+    _DATE_PATTERNS = [
+        # DD MMM YYYY
+        (re.compile(r'(\d{1,2})\s+([A-Za-z]{3,})\s+(\d{4})'), lambda m, month: f"{m[3]}-{month(m[2])}-{m[1].zfill(2)}"),
+        # MMM DD, YYYY
+        (re.compile(r'([A-Za-z]{3,})\s+(\d{1,2}),?\s+(\d{4})'), lambda m, month: f"{m[3]}-{month(m[1])}-{m[2].zfill(2)}"),
+        # MMM YYYY
+        (re.compile(r'([A-Za-z]{3,})\s+(\d{4})'), lambda m, month: f"{m[2]}-{month(m[1])}-01"),
+        # YYYY-MM-DD (already in ISO format)
+        (re.compile(r'(\d{4})-(\d{2})-(\d{2})'), lambda m, month: f"{m[1]}-{m[2]}-{m[3]}"),
+        # DD/MM/YYYY or DD-MM-YYYY
+        (re.compile(r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})'), lambda m, month: f"{m[3]}-{m[2].zfill(2)}-{m[1].zfill(2)}"),
+        # YYYY only
+        (re.compile(r'^(\d{4})$'), lambda m, month: f"{m[1]}-01-01")
+    ]
+
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
         self.individuals: Dict[str, Individual] = {}
@@ -125,6 +293,25 @@ class GedcomParser:
         self.sources: Dict[str, Dict[str, str]] = {}
         self.media: Dict[str, Dict[str, str]] = {}
         self.notes: Dict[str, str] = {}
+        # One shared string per XREF ID, reused by every record that points to it
+        self._id_intern: Dict[str, str] = {}
+
+        # Subordinate-line handlers keyed by the current level 0 record type
+        self._handlers = {
+            'INDI': self._parse_individual_tag,
+            'FAM': self._parse_family_tag,
+            'SOUR': self._parse_source_tag,
+            'NOTE': self._parse_note_tag,
+        }
+
+    @classmethod
+    def _month_number(cls, name: str) -> str:
+        """Return the two-digit month for a month name, defaulting to '01'."""
+        key = name[:3]
+        # GEDCOM months are conventionally uppercase, so most keys skip the upper() copy
+        if not key.isupper():
+            key = key.upper()
+        return cls.MONTH_MAP.get(key, '01')
 
     def parse_date(self, date_str: str) -> Optional[str]:
         """
@@ -139,35 +326,46 @@ class GedcomParser:
         if not date_str:
             return None
 
-        # Remove date qualifiers
+        # Remove date qualifiers, repeating until none is left so stacked ones ("ABT CAL") all go
         cleaned_date = date_str.strip()
-        for qualifier in self.DATE_QUALIFIERS:
-            cleaned_date = re.sub(rf'^{qualifier}\s+', '', cleaned_date, flags=re.IGNORECASE)
+        is_range = False
+        head = cleaned_date[:self._QUAL_PREFIX_LEN].upper()
+        while head.startswith(self._QUAL_PREFIXES):
+            for prefix in self._QUAL_PREFIXES:
+                if head.startswith(prefix):
+                    cleaned_date = cleaned_date[len(prefix):].lstrip()
+                    is_range = is_range or prefix in self._RANGE_PREFIXES
+                    break
+            head = cleaned_date[:self._QUAL_PREFIX_LEN].upper()
+
+        # Keep only the first date of a range, so patterns cannot match across "50 AND 1960"
+        if is_range:
+            cleaned_date = self._RANGE_SEP_RE.split(cleaned_date, 1)[0]
 
         # Remove any parenthetical information
-        cleaned_date = re.sub(r'\([^)]*\)', '', cleaned_date).strip()
+        if '(' in cleaned_date:
+            cleaned_date = self._PAREN_RE.sub('', cleaned_date).strip()
+
+        # Fast paths for the common DD MMM YYYY, MMM YYYY and YYYY forms, skipping the regex patterns
+        parts = cleaned_date.split()
+        if len(parts) == 3:
+            day, month, year = parts
+            if (len(day) <= 2 and day.isdecimal() and len(year) == 4 and year.isdecimal()
+                    and len(month) >= 3 and month.isascii() and month.isalpha()):
+                return self._checked_date(f"{year}-{self._month_number(month)}-{day.zfill(2)}", date_str)
+        elif len(parts) == 2:
+            month, year = parts
+            if len(year) == 4 and year.isdecimal() and len(month) >= 3 and month.isascii() and month.isalpha():
+                return self._checked_date(f"{year}-{self._month_number(month)}-01", date_str)
+        elif len(cleaned_date) == 4 and cleaned_date.isdecimal():
+            return self._checked_date(f"{cleaned_date}-01-01", date_str)
 
         # Try various date patterns
-        patterns = [
-            # DD MMM YYYY
-            (r'(\d{1,2})\s+([A-Za-z]{3,})\s+(\d{4})', lambda m: f"{m[3]}-{self.MONTH_MAP.get(m[2][:3].upper(), '01')}-{m[1].zfill(2)}"),
-            # MMM DD, YYYY
-            (r'([A-Za-z]{3,})\s+(\d{1,2}),?\s+(\d{4})', lambda m: f"{m[3]}-{self.MONTH_MAP.get(m[1][:3].upper(), '01')}-{m[2].zfill(2)}"),
-            # MMM YYYY
-            (r'([A-Za-z]{3,})\s+(\d{4})', lambda m: f"{m[2]}-{self.MONTH_MAP.get(m[1][:3].upper(), '01')}-01"),
-            # YYYY-MM-DD (already in ISO format)
-            (r'(\d{4})-(\d{2})-(\d{2})', lambda m: f"{m[1]}-{m[2]}-{m[3]}"),
-            # DD/MM/YYYY or DD-MM-YYYY
-            (r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})', lambda m: f"{m[3]}-{m[2].zfill(2)}-{m[1].zfill(2)}"),
-            # YYYY only
-            (r'^(\d{4})$', lambda m: f"{m[1]}-01-01")
-        ]
-
-        for pattern, formatter in patterns:
-            match = re.search(pattern, cleaned_date)
+        for pattern, formatter in self._DATE_PATTERNS:
+            match = pattern.search(cleaned_date)
             if match:
                 try:
-                    return formatter(match.groups())
+                    return self._checked_date(formatter(match, self._month_number), date_str)
                 except (KeyError, IndexError):
                     continue
 
@@ -175,6 +373,16 @@ class GedcomParser:
             logger.warning(f"Could not parse date: {date_str}")
         return None
 
+    def _checked_date(self, iso_date: str, date_str: str) -> Optional[str]:
+        """Return iso_date if it is a real calendar date, otherwise None."""
+        try:
+            date.fromisoformat(iso_date)
+        except ValueError:
+            if self.verbose:
+                logger.warning(f"Invalid date {iso_date} parsed from: {date_str}")
+            return None
+        return iso_date
+
     def parse_line(self, line: str) -> Tuple[int, str, Optional[str], Optional[str]]:
         """
         Parse a GEDCOM line into its components.
@@ -186,38 +394,60 @@ class GedcomParser:
             Tuple of (level, xref_id, tag, value)
         """
         line = line.strip()
-        if not line:
+        level_str, sep, rest = line.partition(' ')
+        if not sep:
             return -1, "", None, None
 
-        parts = line.split(' ', 2)
-        if len(parts) < 2:
-            return -1, "", None, None
+        if not level_str.isdecimal():
+            raise ValueError(f"invalid level '{level_str}'")
+        level = int(level_str)
 
-        level = int(parts[0])
+        first, sep, value = rest.partition(' ')
 
         # Check if this is a record with XREF ID (e.g., "0 @I1@ INDI")
-        if parts[1].startswith('@') and parts[1].endswith('@'):
-            xref_id = parts[1][1:-1]  # Remove @ symbols
-            tag = parts[2] if len(parts) > 2 else None
+        if first and first[0] == '@' and first[-1] == '@':
+            # Only level 0 record headers carry an XREF ID; the subordinate-line handlers expect a value
+            if level:
+                raise ValueError(f"unexpected XREF ID {first} on a level {level} line")
+            xref_id = first[1:-1]  # Remove @ symbols
+            xref_id = self._id_intern.setdefault(xref_id, xref_id)
+            # Only a bare tag is interned; "0 @N1@ NOTE text" leaves free text in the remainder
+            if not sep:
+                tag = None
+            elif ' ' in value:
+                tag = value
+            else:
+                tag = sys.intern(value)
             value = None
         else:
             xref_id = ""
-            tag = parts[1]
-            value = parts[2] if len(parts) > 2 else ""
+            tag = sys.intern(first)
 
         return level, xref_id, tag, value
 
-    def parse_file(self, file_path: str, encoding: str = 'utf-8-sig') -> Dict[str, Any]:
+    def parse_file(self, file_path: str, encoding: str = 'utf-8-sig', skip_empty: bool = False) -> Dict[str, Any]:
         """
         Parse a GEDCOM file and convert it to GEN-JSON format.
 
         Args:
             file_path: Path to the GEDCOM file
             encoding: File encoding (default: utf-8-sig to handle BOM)
+            skip_empty: Omit empty fields and an empty families section
 
         Returns:
             Dictionary containing the GEN-JSON data
         """
+        self.read_file(file_path, encoding)
+        return self._build_output(skip_empty)
+
+    def read_file(self, file_path: str, encoding: str = 'utf-8-sig'):
+        """
+        Parse a GEDCOM file into this parser's records without building the output.
+
+        Args:
+            file_path: Path to the GEDCOM file
+            encoding: File encoding (default: utf-8-sig to handle BOM)
+        """
         try:
             with open(file_path, 'r', encoding=encoding) as f:
                 self._parse_lines(f)
@@ -234,206 +464,179 @@ class GedcomParser:
         # Post-process relationships
         self._process_relationships()
 
-        return self._build_output()
+    def _ref(self, value: str) -> str:
+        """Return the shared ID string for an @XREF@ pointer value."""
+        ref = _xref(value)
+        return self._id_intern.setdefault(ref, ref)
 
     def _parse_lines(self, file_handle):
         """Parse lines from the file handle."""
-        current_record = None
-        current_record_type = None
-        current_event = None
-        current_note_id = None
+        state = _ParseState()
 
         for line_num, line in enumerate(file_handle, 1):
             try:
                 level, xref_id, tag, value = self.parse_line(line)
-
-                if level == -1:
-                    continue
-
-                # Handle level 0 records
-                if level == 0:
-                    current_event = None
-
-                    if xref_id:
-                        if tag == 'INDI':
-                            current_record = Individual(id=xref_id)
-                            current_record_type = 'INDI'
-                            self.individuals[xref_id] = current_record
-                        elif tag == 'FAM':
-                            current_record = Family(id=xref_id)
-                            current_record_type = 'FAM'
-                            self.families[xref_id] = current_record
-                        elif tag == 'SOUR':
-                            current_record = {'title': '', 'description': ''}
-                            current_record_type = 'SOUR'
-                            self.sources[xref_id] = current_record
-                        elif tag == 'NOTE':
-                            current_note_id = xref_id
-                            self.notes[xref_id] = value or ""
-                            current_record_type = 'NOTE'
-                        else:
-                            current_record = None
-                            current_record_type = None
-                    else:
-                        current_record = None
-                        current_record_type = None
-
-                # Handle subordinate levels
-                elif current_record_type == 'INDI' and isinstance(current_record, Individual):
-                    self._parse_individual_tag(level, tag, value, current_record, current_event)
-                    if tag in ['BIRT', 'DEAT', 'BAPM', 'CHR', 'BURI']:
-                        current_event = tag
-
-                elif current_record_type == 'FAM' and isinstance(current_record, Family):
-                    self._parse_family_tag(level, tag, value, current_record, current_event)
-                    if tag == 'MARR':
-                        current_event = tag
-
-                elif current_record_type == 'SOUR' and isinstance(current_record, dict):
-                    if level == 1:
-                        if tag == 'TITL':
-                            current_record['title'] = value
-                        elif tag == 'TEXT':
-                            current_record['description'] = value
-
-                elif current_record_type == 'NOTE' and current_note_id:
-                    if level == 1 and tag == 'CONT':
-                        self.notes[current_note_id] += '\n' + value
-
-            except Exception as e:
+            except ValueError as e:
                 logger.warning(f"Error parsing line {line_num}: {line.strip()} - {e}")
+                continue
+
+            # Blank lines, and anything nested deeper than level 2, carry nothing we convert
+            if level == -1 or level > 2:
+                continue
+
+            self._handle_tokens(level, xref_id, tag, value, state)
+
+        if state.note_parts is not None:
+            self._close_note(state)
+
+    def _handle_tokens(self, level: int, xref_id: str, tag: Optional[str], value: Optional[str], state: _ParseState):
+        """Apply one parsed GEDCOM line to the record currently being built."""
+        # Handle level 0 records
+        if level == 0:
+            state.event = None
+            if state.note_parts is not None:
+                self._close_note(state)
+
+            if xref_id:
+                if tag == 'INDI':
+                    state.record = Individual(id=xref_id)
+                    state.record_type = 'INDI'
+                    self.individuals[xref_id] = state.record
+                elif tag == 'FAM':
+                    state.record = Family(id=xref_id)
+                    state.record_type = 'FAM'
+                    self.families[xref_id] = state.record
+                elif tag == 'SOUR':
+                    state.record = {'title': '', 'description': ''}
+                    state.record_type = 'SOUR'
+                    self.sources[xref_id] = state.record
+                elif tag == 'NOTE':
+                    state.note_id = xref_id
+                    state.note_parts = [value or ""]
+                    state.record_type = 'NOTE'
+                else:
+                    state.record = None
+                    state.record_type = None
+            else:
+                state.record = None
+                state.record_type = None
+
+        # Handle subordinate levels
+        else:
+            handler = self._handlers.get(state.record_type)
+            if handler:
+                handler(level, tag, value, state)
 
-    def _parse_individual_tag(self, level: int, tag: str, value: str, individual: Individual, current_event: Optional[str]):
+    def _parse_individual_tag(self, level: int, tag: str, value: str, state: _ParseState):
         """Parse tags for an individual record."""
+        individual = state.record
+        current_event = state.event
+        if tag in ['BIRT', 'DEAT', 'BAPM', 'CHR', 'BURI']:
+            state.event = tag
+
         if level == 1:
-            if tag == 'NAME':
-                # Remove slashes used to denote surnames
-                individual.full_name = value.replace('/', '').strip()
-            elif tag == 'SEX':
-                individual.sex = value.strip() if value.strip() in ['M', 'F'] else 'U'
-            elif tag == 'FAMS':
-                spouse_fam_id = value.strip('@')
-                if spouse_fam_id not in individual.spouses:
-                    individual.spouses.append(spouse_fam_id)
-            elif tag == 'FAMC':
-                # This will be processed in relationship processing
-                pass
-            elif tag == 'NOTE':
-                if value.startswith('@'):
-                    # Reference to a NOTE record
-                    note_id = value.strip('@')
-                    if note_id in self.notes:
-                        individual.notes.append(self.notes[note_id])
-                else:
-                    individual.notes.append(value)
-            elif tag == 'SOUR':
-                if value.startswith('@'):
-                    source_id = value.strip('@')
-                    individual.sources.append(source_id)
+            handler = _INDI_L1_HANDLERS.get(tag)
+            if handler:
+                handler(individual, value, self)
 
         elif level == 2 and current_event:
-            if tag == 'DATE':
-                date = self.parse_date(value)
-                if date:
-                    if current_event == 'BIRT':
-                        individual.birth['date'] = date
-                    elif current_event == 'DEAT':
-                        individual.death['date'] = date
-            elif tag == 'PLAC':
-                if current_event == 'BIRT':
-                    individual.birth['place'] = value
-                elif current_event == 'DEAT':
-                    individual.death['place'] = value
-
-    def _parse_family_tag(self, level: int, tag: str, value: str, family: Family, current_event: Optional[str]):
+            handler = _EVENT_L2_HANDLERS.get(tag)
+            if handler is None:
+                return
+            if current_event == 'BIRT':
+                if individual.birth is None:
+                    individual.birth = {}
+                event = individual.birth
+            elif current_event == 'DEAT':
+                if individual.death is None:
+                    individual.death = {}
+                event = individual.death
+            else:
+                return
+            handler(event, value, self)
+
+    def _parse_family_tag(self, level: int, tag: str, value: str, state: _ParseState):
         """Parse tags for a family record."""
+        family = state.record
+        current_event = state.event
+        if tag == 'MARR':
+            state.event = tag
+
         if level == 1:
-            if tag == 'HUSB':
-                family.husband = value.strip('@')
-            elif tag == 'WIFE':
-                family.wife = value.strip('@')
-            elif tag == 'CHIL':
-                child_id = value.strip('@')
-                if child_id not in family.children:
-                    family.children.append(child_id)
-            elif tag == 'NOTE':
-                if value.startswith('@'):
-                    note_id = value.strip('@')
-                    if note_id in self.notes:
-                        family.notes.append(self.notes[note_id])
-                else:
-                    family.notes.append(value)
+            handler = _FAM_L1_HANDLERS.get(tag)
+            if handler:
+                handler(family, value, self)
 
         elif level == 2 and current_event == 'MARR':
-            if tag == 'DATE':
-                date = self.parse_date(value)
-                if date:
-                    family.marriage['date'] = date
-            elif tag == 'PLAC':
-                family.marriage['place'] = value
+            handler = _EVENT_L2_HANDLERS.get(tag)
+            if handler:
+                if family.marriage is None:
+                    family.marriage = {}
+                handler(family.marriage, value, self)
+
+    def _parse_source_tag(self, level: int, tag: str, value: str, state: _ParseState):
+        """Parse tags for a source record."""
+        if level == 1:
+            handler = _SOUR_L1_HANDLERS.get(tag)
+            if handler:
+                handler(state.record, value, self)
+
+    def _parse_note_tag(self, level: int, tag: str, value: str, state: _ParseState):
+        """Parse continuation lines of a note record."""
+        if level == 1 and tag == 'CONT':
+            state.note_parts.append(value)
+
+    def _close_note(self, state: _ParseState):
+        """Store the text of the NOTE record that just ended."""
+        self.notes[state.note_id] = '\n'.join(state.note_parts)
+        state.note_parts = None
 
     def _process_relationships(self):
         """Process family relationships to update individual records."""
-        # First, process parent-child relationships
         for family_id, family in self.families.items():
             husband_id = family.husband
             wife_id = family.wife
+            husband = self.individuals.get(husband_id) if husband_id else None
+            wife = self.individuals.get(wife_id) if wife_id else None
 
             # Add children to parents and parents to children
             for child_id in family.children:
-                if child_id in self.individuals:
-                    child = self.individuals[child_id]
-
-                    # Add parents to child
-                    if husband_id and husband_id in self.individuals:
-                        if husband_id not in child.parents:
-                            child.parents.append(husband_id)
-                        # Add child to father
-                        if child_id not in self.individuals[husband_id].children:
-                            self.individuals[husband_id].children.append(child_id)
-
-                    if wife_id and wife_id in self.individuals:
-                        if wife_id not in child.parents:
-                            child.parents.append(wife_id)
-                        # Add child to mother
-                        if child_id not in self.individuals[wife_id].children:
-                            self.individuals[wife_id].children.append(child_id)
-
-        # Update spouse relationships from family records
-        for family_id, family in self.families.items():
-            if family.husband and family.wife:
-                # Replace family ID with actual spouse ID
-                if family.husband in self.individuals:
-                    husband = self.individuals[family.husband]
-                    # Remove family ID and add spouse ID
-                    if family_id in husband.spouses:
-                        husband.spouses.remove(family_id)
-                    if family.wife and family.wife not in husband.spouses:
-                        husband.spouses.append(family.wife)
-
-                if family.wife in self.individuals:
-                    wife = self.individuals[family.wife]
-                    # Remove family ID and add spouse ID
-                    if family_id in wife.spouses:
-                        wife.spouses.remove(family_id)
-                    if family.husband and family.husband not in wife.spouses:
-                        wife.spouses.append(family.husband)
-
-    def _build_output(self) -> Dict[str, Any]:
+                child = self.individuals.get(child_id)
+                if child is None:
+                    continue
+
+                # Add parents to child and child to father
+                if husband is not None:
+                    child.parents[husband_id] = None
+                    husband.children[child_id] = None
+
+                # Add parents to child and child to mother
+                if wife is not None:
+                    child.parents[wife_id] = None
+                    wife.children[child_id] = None
+
+            # Replace the family ID in each spouse list with the actual spouse ID
+            if husband_id and wife_id:
+                if husband is not None:
+                    husband.spouses.pop(family_id, None)
+                    husband.spouses[wife_id] = None
+
+                if wife is not None:
+                    wife.spouses.pop(family_id, None)
+                    wife.spouses[husband_id] = None
+
+    def _build_output(self, skip_empty: bool = False) -> Dict[str, Any]:
         """Build the final GEN-JSON output."""
         output = {
             "version": "1.0",
-            "individuals": {},
-            "families": {}
+            "individuals": {ind_id: individual.to_dict(skip_empty)
+                            for ind_id, individual in self.individuals.items()}
         }
 
-        # Convert individuals
-        for ind_id, individual in self.individuals.items():
-            output["individuals"][ind_id] = individual.to_dict()
-
         # Convert families
-        for fam_id, family in self.families.items():
-            output["families"][fam_id] = family.to_dict()
+        if not skip_empty or self.families:
+            output["families"] = {fam_id: family.to_dict(skip_empty)
+                                  for fam_id, family in self.families.items()}
 
         # Add sources if present
         if self.sources:
@@ -445,6 +648,95 @@ class GedcomParser:
 
         return output
 
+    def write_json(self, fp, skip_empty: bool = False, indent: Optional[int] = None):
+        """
+        Stream GEN-JSON to a binary file one record at a time.
+
+        Produces the same bytes as dumping self._build_output(skip_empty) in one
+        call, without holding the whole output in memory. orjson is used for
+        compact or 2-space output when installed, otherwise the json module.
+
+        Args:
+            fp: File opened in binary write mode
+            skip_empty: Omit empty fields and an empty families section
+            indent: Spaces per indentation level, or None for compact output
+        """
+        if orjson is not None and indent in (None, 2):
+            option = 0 if indent is None else orjson.OPT_INDENT_2
+            dumps = lambda obj: orjson.dumps(obj, option=option)
+            item_sep, key_sep = b',', (b':' if indent is None else b': ')
+        else:
+            dumps = lambda obj: json.dumps(obj, indent=indent, ensure_ascii=False).encode('utf-8')
+            item_sep, key_sep = (b', ' if indent is None else b','), b': '
+
+        # Line breaks and padding for members of the top-level object and of its sections
+        newline = b'' if indent is None else b'\n'
+        pad = newline + b' ' * (indent or 0)
+        section_pad = newline + b' ' * (2 * (indent or 0))
+
+        def write_value(value, value_pad):
+            encoded = dumps(value)
+            if indent is not None:
+                encoded = encoded.replace(b'\n', value_pad)
+            fp.write(encoded)
+
+        def write_section(name, records):
+            fp.write(item_sep + pad + dumps(name) + key_sep + b'{')
+            first = True
+            for record_id, record in records.items():
+                fp.write((section_pad if first else item_sep + section_pad) + dumps(record_id) + key_sep)
+                write_value(record.to_dict(skip_empty), section_pad)
+                first = False
+            fp.write(b'}' if first else pad + b'}')
+
+        fp.write(b'{' + pad + b'"version"' + key_sep + b'"1.0"')
+        write_section("individuals", self.individuals)
+
+        if not skip_empty or self.families:
+            write_section("families", self.families)
+
+        if self.sources:
+            fp.write(item_sep + pad + b'"sources"' + key_sep)
+            write_value(self.sources, pad)
+
+        if self.media:
+            fp.write(item_sep + pad + b'"media"' + key_sep)
+            write_value(self.media, pad)
+
+        fp.write(newline + b'}')
+
+    def write_jsonl(self, fp, skip_empty: bool = False, gen_json_data: Optional[Dict[str, Any]] = None):
+        """
+        Write GEN-JSON as JSON Lines, one record per line.
+
+        The first line is a header carrying the format version. Every other line
+        is a record tagged with its type ("indi", "fam", "sour" or "media") and
+        its ID, followed by the record's own fields.
+
+        Args:
+            fp: File opened in binary write mode
+            skip_empty: Omit empty fields from each record
+            gen_json_data: Output of parse_file, written as is instead of converting
+                the records again; skip_empty is then already applied
+        """
+        if orjson is not None:
+            dumps = orjson.dumps
+        else:
+            dumps = lambda obj: json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+        if gen_json_data is not None:
+            individuals = gen_json_data["individuals"].items()
+            families = gen_json_data.get("families", {}).items()
+        else:
+            individuals = ((record_id, record.to_dict(skip_empty)) for record_id, record in self.individuals.items())
+            families = ((record_id, record.to_dict(skip_empty)) for record_id, record in self.families.items())
+
+        fp.write(dumps({"type": "header", "version": "1.0"}) + b'\n')
+        for record_type, records in (("indi", individuals), ("fam", families),
+                                     ("sour", self.sources.items()), ("media", self.media.items())):
+            for record_id, record in records:
+                fp.write(dumps({"type": record_type, "id": record_id, **record}) + b'\n')
+
 
 def validate_gen_json(data: Dict[str, Any]) -> List[str]:
     """
@@ -464,29 +756,31 @@ def validate_gen_json(data: Dict[str, Any]) -> List[str]:
     if "individuals" not in data:
         errors.append("Missing required field: individuals")
 
-    # Validate individuals
-    if "individuals" in data:
-        for ind_id, individual in data["individuals"].items():
-            if "full_name" not in individual:
-                errors.append(f"Individual {ind_id}: missing required field 'full_name'")
-            if "sex" not in individual:
-                errors.append(f"Individual {ind_id}: missing required field 'sex'")
-            elif individual["sex"] not in ["M", "F", "U"]:
-                errors.append(f"Individual {ind_id}: invalid sex value '{individual['sex']}'")
-
-            # Validate dates if present
-            for event in ["birth", "death"]:
-                if event in individual and "date" in individual[event]:
-                    date_str = individual[event]["date"]
+    individuals = data.get("individuals", {})
+    all_individual_ids = set(individuals)
+
+    # Validate individuals and their relationships in a single pass
+    for ind_id, individual in individuals.items():
+        if "full_name" not in individual:
+            errors.append(f"Individual {ind_id}: missing required field 'full_name'")
+        if "sex" not in individual:
+            errors.append(f"Individual {ind_id}: missing required field 'sex'")
+        elif individual["sex"] not in ["M", "F", "U"]:
+            errors.append(f"Individual {ind_id}: invalid sex value '{individual['sex']}'")
+
+        # Validate dates if present
+        for event in ["birth", "death"]:
+            if event in individual and "date" in individual[event]:
+                date_str = individual[event]["date"]
+                valid = _ISO_DATE_RE.fullmatch(date_str) is not None
+                if valid:
                     try:
-                        datetime.strptime(date_str, "%Y-%m-%d")
+                        date.fromisoformat(date_str)
                     except ValueError:
-                        errors.append(f"Individual {ind_id}: invalid {event} date format '{date_str}'")
-
-    # Validate relationships
-    all_individual_ids = set(data.get("individuals", {}).keys())
+                        valid = False
+                if not valid:
+                    errors.append(f"Individual {ind_id}: invalid {event} date format '{date_str}'")
 
-    for ind_id, individual in data.get("individuals", {}).items():
         # Check parent references
         for parent_id in individual.get("parents", []):
             if parent_id not in all_individual_ids:
@@ -520,6 +814,8 @@ def main():
     parser.add_argument('--compact', action='store_true', help='Output compact JSON (no indentation)')
     parser.add_argument('--indent', type=int, default=2, help='Number of spaces for indentation (default: 2)')
     parser.add_argument('--skip-empty', action='store_true', help='Skip empty fields in the output')
+    parser.add_argument('--jsonl', action='store_true',
+                        help='Output JSON Lines, one record per line (streamed only with --no-validate)')
     parser.add_argument('--encoding', default='utf-8-sig', help='Input file encoding (default: utf-8-sig)')
 
     args = parser.parse_args()
@@ -530,32 +826,24 @@ def main():
     else:
         logger.setLevel(logging.WARNING)
 
-    # Check input file exists
-    if not os.path.exists(args.input_file):
-        logger.error(f"Input file '{args.input_file}' not found.")
-        sys.exit(1)
-
     try:
         # Parse GEDCOM file
         logger.info(f"Parsing GEDCOM file: {args.input_file}")
         parser_instance = GedcomParser(verbose=args.verbose)
-        gen_json_data = parser_instance.parse_file(args.input_file, encoding=args.encoding)
-
-        # Apply skip-empty if requested
-        if args.skip_empty:
-            # Rebuild with skip_empty flag
-            for ind_id, individual in parser_instance.individuals.items():
-                gen_json_data["individuals"][ind_id] = individual.to_dict(skip_empty=True)
-            for fam_id, family in parser_instance.families.items():
-                gen_json_data["families"][fam_id] = family.to_dict(skip_empty=True)
-
-            # Remove empty top-level sections
-            if not gen_json_data.get("families"):
-                gen_json_data.pop("families", None)
-            if not gen_json_data.get("sources"):
-                gen_json_data.pop("sources", None)
-            if not gen_json_data.get("media"):
-                gen_json_data.pop("media", None)
+
+        # Without validation the full output is never needed, so it is streamed record by record
+        stream_output = args.no_validate
+        try:
+            if stream_output:
+                parser_instance.read_file(args.input_file, encoding=args.encoding)
+                gen_json_data = None
+            else:
+                gen_json_data = parser_instance.parse_file(args.input_file, encoding=args.encoding,
+                                                           skip_empty=args.skip_empty)
+        except FileNotFoundError as e:
+            # Missing input file; the message already names it
+            logger.error(str(e))
+            sys.exit(1)
 
         # Validate output
         if not args.no_validate:
@@ -572,28 +860,43 @@ def main():
         # Write output
         indent = None if args.compact else args.indent
 
-        with open(args.output_file, 'w', encoding='utf-8') as f:
-            json.dump(gen_json_data, f, indent=indent, ensure_ascii=False)
+        # orjson only supports 2-space indentation; other widths use the stdlib
+        if orjson is not None and indent not in (None, 2) and not args.jsonl:
+            logger.warning(f"orjson only supports an indent of 2; using the json module for --indent {indent}")
+
+        if args.jsonl:
+            with open(args.output_file, 'wb') as f:
+                parser_instance.write_jsonl(f, skip_empty=args.skip_empty, gen_json_data=gen_json_data)
+        elif stream_output:
+            with open(args.output_file, 'wb') as f:
+                parser_instance.write_json(f, skip_empty=args.skip_empty, indent=indent)
+        elif orjson is not None and indent in (None, 2):
+            option = 0 if indent is None else orjson.OPT_INDENT_2
+            with open(args.output_file, 'wb') as f:
+                f.write(orjson.dumps(gen_json_data, option=option))
+        else:
+            with open(args.output_file, 'w', encoding='utf-8') as f:
+                json.dump(gen_json_data, f, indent=indent, ensure_ascii=False)
 
         # Print summary
         print(f"\n✓ Conversion complete! Saved to {args.output_file}")
 
         stats = []
-        stats.append(f"{len(gen_json_data.get('individuals', {}))} individuals")
-        stats.append(f"{len(gen_json_data.get('families', {}))} families")
+        stats.append(f"{len(parser_instance.individuals)} individuals")
+        stats.append(f"{len(parser_instance.families)} families")
 
-        if 'sources' in gen_json_data:
-            stats.append(f"{len(gen_json_data['sources'])} sources")
-        if 'media' in gen_json_data:
-            stats.append(f"{len(gen_json_data['media'])} media items")
+        if parser_instance.sources:
+            stats.append(f"{len(parser_instance.sources)} sources")
+        if parser_instance.media:
+            stats.append(f"{len(parser_instance.media)} media items")
 
         print(f"  Converted: {', '.join(stats)}")
 
         # Show sample if verbose
-        if args.verbose and gen_json_data.get('individuals'):
+        if args.verbose and parser_instance.individuals:
             print("\nSample individual:")
-            first_id = next(iter(gen_json_data['individuals']))
-            print(json.dumps({first_id: gen_json_data['individuals'][first_id]}, indent=2))
+            first_id, first_individual = next(iter(parser_instance.individuals.items()))
+            print(json.dumps({first_id: first_individual.to_dict(args.skip_empty)}, indent=2))
 
     except Exception as e:
         logger.error(f"Error during conversion: {e}")